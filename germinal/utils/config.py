@@ -23,22 +23,107 @@ Dependencies:
     - Bio libraries for PDB manipulation
 """
 
+import functools
 import os
-from typing import Dict, Any
-from omegaconf import DictConfig, OmegaConf
+import stat
+from collections import ChainMap
+from typing import Dict, Any, Union
+from omegaconf import MISSING, DictConfig, OmegaConf
 import warnings
 
-from germinal.utils.utils import (
-    get_jax_device,
-    get_torch_device,
-    compute_cdr_positions,
-    create_starting_structure,
-    get_sequence_from_pdb,
-)
-from germinal.utils.io import RunLayout, IO
+# NOTE: germinal.utils.utils pulls in JAX and Torch, so it (and the I/O layer)
+# is imported inside initialize_germinal_run to keep process_config cheap.
 
+# AF2 model indices used for design
+_MULTIMER_MODELS = (0, 1, 2, 3, 4)
+_MONOMER_MODELS = (0, 1)
 
-def process_config(cfg: DictConfig) -> Dict[str, Any]:
+
+def _stat_or_none(path: str):
+    """Return ``os.stat(path)``, or None where ``os.path.exists`` would be False.
+
+    Deliberately uncached: PDBs may be deleted or regenerated between runs, and
+    the mtime from this stat is what lets the sequence cache detect staleness.
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _join_design_path(*parts: str) -> str:
+    """Join design path components, bypassing ``os.path.join`` on plain POSIX input.
+
+    Falls back to ``os.path.join`` on non-POSIX separators or when a later
+    component is absolute, so its reset semantics are preserved.
+    """
+    if os.sep == "/" and not any(p.startswith("/") for p in parts[1:]):
+        return "/".join(p for p in parts if p)
+    return os.path.join(*parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_devices():
+    """Query JAX and Torch devices once per process.
+
+    Returns:
+        tuple: (jax_devices, torch_device) as returned by ``get_jax_device`` and
+            ``get_torch_device``.
+    """
+    from germinal.utils.utils import get_jax_device, get_torch_device
+
+    return get_jax_device(), get_torch_device()
+
+
+@functools.lru_cache(maxsize=256)
+def _cdr_positions_cached(cdr_t: tuple, fw_t: tuple) -> tuple:
+    """Memoized ``compute_cdr_positions`` over hashable length tuples."""
+    from germinal.utils.utils import compute_cdr_positions
+
+    return tuple(compute_cdr_positions(list(cdr_t), list(fw_t)))
+
+
+@functools.lru_cache(maxsize=64)
+def _seq_from_pdb_cached(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse chain sequences from a PDB, keyed on modification time."""
+    from germinal.utils.utils import get_sequence_from_pdb
+
+    return get_sequence_from_pdb(path)
+
+
+def _seq(path: str) -> Dict[str, str]:
+    """Return chain sequences for ``path``, re-parsing only if the file changed."""
+    return _seq_from_pdb_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _seq_for_chain(path: str, chain: str) -> str:
+    """Return the cached sequence of a single chain in ``path``."""
+    return _seq(path)[chain]
+
+
+def _child(container: Any, key: str, default: Any = None) -> Any:
+    """Fetch ``container[key]``, returning ``default`` if absent and ``???`` as-is.
+
+    Membership is checked up front because struct-mode configs (as passed in by
+    Hydra) raise on absent keys rather than falling back to a default.
+    """
+    if isinstance(container, DictConfig):
+        if key not in container.keys():
+            return default
+        if OmegaConf.is_missing(container, key):
+            return MISSING
+        return container[key]
+    return container.get(key, default)
+
+
+def _to_plain(value: Any) -> Any:
+    """Resolve an OmegaConf sub-config to plain Python containers; pass others through."""
+    if OmegaConf.is_config(value):
+        return OmegaConf.to_container(value, resolve=True, throw_on_missing=False)
+    return value
+
+
+def process_config(cfg: Union[DictConfig, Dict[str, Any]]) -> Dict[str, Any]:
     """Process Hydra configuration and convert to system-expected format.
     
     Takes a Hydra DictConfig object and converts it into the standardized format
@@ -46,8 +131,9 @@ def process_config(cfg: DictConfig) -> Dict[str, Any]:
     target specifications, and filtering criteria.
     
     Args:
-        cfg (DictConfig): Hydra configuration object containing nested configuration
-            sections including 'target', 'filter', and run parameters.
+        cfg (DictConfig | Dict[str, Any]): Hydra configuration object containing nested
+            configuration sections including 'target', 'filter', and run parameters.
+            Plain dicts (e.g. from non-Hydra entry points) are used as-is.
             
     Returns:
         Dict[str, Any]: Processed configuration dictionary with four main keys:
@@ -55,20 +141,34 @@ def process_config(cfg: DictConfig) -> Dict[str, Any]:
             - 'target': Target-specific configuration parameters
             - 'filters_initial': Initial filtering criteria for trajectory screening
             - 'filters_final': Final filtering criteria for design acceptance
+            
+    Example:
+        Plain dicts and DictConfigs (struct mode, as passed by Hydra, or not)
+        produce the same output, with absent sections defaulting to ``{}``:
+        
+        >>> raw = {"seed": 1, "target": {"target_name": "pdl1"}, "filter": {"initial": {}}}
+        >>> cfg = OmegaConf.create(raw)
+        >>> strict = OmegaConf.create(raw)
+        >>> OmegaConf.set_struct(strict, True)
+        >>> process_config(raw) == process_config(cfg) == process_config(strict)
+        True
+        >>> process_config(strict)["filters_final"]
+        {}
     """
-    # Convert OmegaConf to regular dict for compatibility
-    config_dict = OmegaConf.to_container(cfg, resolve=True)
+    # Convert only the sections callers read. Child nodes stay attached to the
+    # root config, so cross-section interpolations still resolve. Plain dicts
+    # take the same path; _child and _to_plain pass their values through as-is.
+    target_config = _to_plain(_child(cfg, "target", {}))
+    filter_config = _child(cfg, "filter", {})
 
-    # Extract the main sections
-    target_config = config_dict.get("target", {})
-    filter_config = config_dict.get("filter", {})
-
-    # Build run config by excluding target and filter sections
-    run_config = {k: v for k, v in config_dict.items() if k not in ["target", "filter"]}
+    # Build run config from every top-level key except target and filter
+    run_config = {
+        k: _to_plain(_child(cfg, k)) for k in cfg.keys() if k not in ("target", "filter")
+    }
 
     # Extract initial and final filters
-    filters_initial = filter_config.get("initial", {})
-    filters_final = filter_config.get("final", {})
+    filters_initial = _to_plain(_child(filter_config, "initial", {}))
+    filters_final = _to_plain(_child(filter_config, "final", {}))
 
     # Return the four-key structure as requested
     processed_cfg = {
@@ -114,7 +214,8 @@ def initialize_germinal_run(
     Returns:
         tuple: (io, run_settings) where:
             - io (IO): Initialized I/O handler for the run with directory structure
-            - run_settings (Dict[str, Any]): Updated run settings with additional fields:
+            - run_settings (Dict[str, Any]): New dict of run settings (the input is
+                left unmodified) with additional fields:
                 * cdr_positions: Computed CDR residue positions
                 * starting_binder_seq: Extracted binder sequence from starting structure
                 * starting_pdb_complex: Path to the starting PDB complex
@@ -124,12 +225,19 @@ def initialize_germinal_run(
         AssertionError: If JAX device is not available or CUDA is not accessible
         AssertionError: If target PDB path does not exist
     """
+    from germinal.utils.utils import create_starting_structure
+    from germinal.utils.io import RunLayout, IO
+
+    # Layer updates over the caller's settings so their dict is never mutated
+    run_settings = ChainMap({}, run_settings)
+
     # Validate computational device availability for design execution
-    assert get_jax_device(), "JAX device not available"
-    if get_torch_device() != "cuda":
+    jax_devices, torch_device = _probe_devices()
+    assert jax_devices, "JAX device not available"
+    if torch_device != "cuda":
         warnings.warn("Torch device not available")
     # Construct hierarchical directory path for design outputs
-    design_path = os.path.join(
+    design_path = _join_design_path(
         run_settings.get("project_dir", "."),
         run_settings.get("results_dir", "results"),
         run_settings.get("experiment_name", "germinal_run"),
@@ -137,15 +245,14 @@ def initialize_germinal_run(
     )
     # Initialize directory structure and I/O handler
     design_paths = RunLayout.create(design_path)
-    # Persist configuration parameters to file system
     io = IO(design_paths)
-    io.save_run_config(run_settings, target_settings)
 
     # Compute CDR residue positions from framework and CDR lengths
-    cdr_str = "_".join(str(i) for i in run_settings.get("cdr_lengths"))
-    cdr_positions = compute_cdr_positions(
-        run_settings.get("cdr_lengths"), run_settings.get("fw_lengths")
-    )
+    cdr_lengths = run_settings["cdr_lengths"]
+    fw_lengths = run_settings["fw_lengths"]
+    cdr_str = "_".join(map(str, cdr_lengths))
+    # Copy out of the cache so callers may mutate their list freely
+    cdr_positions = list(_cdr_positions_cached(tuple(cdr_lengths), tuple(fw_lengths)))
     run_settings["cdr_positions"] = cdr_positions
     # Determine path for starting PDB complex based on binder type
     binder_type = run_settings.get("type", "nb")
@@ -157,9 +264,11 @@ def initialize_germinal_run(
         run_settings.get("pdb_dir", "pdbs"), f"{complex_name}.pdb"
     )
     # Generate starting complex if not present, otherwise use existing structure
-    if not os.path.exists(starting_pdb_complex):
+    if _stat_or_none(starting_pdb_complex) is None:
         target_pdb_path = target_settings.get("target_pdb_path")
-        assert os.path.exists(target_pdb_path), (
+        # A single stat covers both the existence and regular-file checks
+        target_stat = _stat_or_none(target_pdb_path)
+        assert target_stat is not None and stat.S_ISREG(target_stat.st_mode), (
             f"Target PDB path does not exist: {target_pdb_path}"
         )
         template_binder_pdb = os.path.join(
@@ -173,18 +282,21 @@ def initialize_germinal_run(
             target_chain=target_settings.get("target_chain", "A"),
         )
 
-    run_settings["starting_binder_seq"] = get_sequence_from_pdb(starting_pdb_complex)[
-        target_settings.get("binder_chain", "B")
-    ]
+    run_settings["starting_binder_seq"] = _seq_for_chain(
+        starting_pdb_complex, target_settings.get("binder_chain", "B")
+    )
     run_settings["starting_pdb_complex"] = starting_pdb_complex
 
     # Apply configuration updates and validation logic
-    if run_settings.get("use_multimer_design"):
-        run_settings["design_models"] = [0, 1, 2, 3, 4]
-    else:
-        run_settings["design_models"] = [0, 1]
-    # Normalize negative bias values to False for consistency
-    if run_settings.get("bias_redesign") < 0:
+    run_settings["design_models"] = list(
+        _MULTIMER_MODELS if run_settings.get("use_multimer_design") else _MONOMER_MODELS
+    )
+    # Normalize negative bias values to False for consistency (unset counts as 0)
+    if (run_settings.get("bias_redesign") or 0) < 0:
         run_settings["bias_redesign"] = False
 
+    # Flatten the overlay and persist the fully populated configuration
+    run_settings = dict(run_settings)
+    io.save_run_config(run_settings, target_settings)
+
     return io, run_settings
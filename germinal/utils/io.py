@@ -351,10 +351,12 @@ class IO:
             run_settings (Dict[str, Any]): Complete run configuration parameters
             target_settings (Dict[str, Any]): Target-specific configuration parameters
         """
-        with open(self.layout.final_config, "w") as f:
-            yaml.dump(
-                {"run_settings": run_settings, "target_settings": target_settings}, f
-            )
+        # Serialize up front so the file is written in a single call
+        config_yaml = yaml.dump(
+            {"run_settings": run_settings, "target_settings": target_settings}
+        )
+        with open(self.layout.final_config, "w", buffering=1024 * 1024) as f:
+            f.write(config_yaml)
 
         print(f"Run and target settings saved to {self.layout.final_config}")
 
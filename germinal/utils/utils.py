@@ -24,7 +24,8 @@ Key Function Categories:
         clear_memory
         
     PDB Processing:
-        clean_pdb, get_sequence_from_pdb, create_starting_structure
+        clean_pdb, get_sequence_from_pdb, get_chain_sequence_from_pdb,
+        create_starting_structure
         
     Structural Analysis:
         hotspot_residues, calculate_clash_score, calc_ss_percentage
@@ -46,6 +47,7 @@ Dependencies:
 
 import time
 import gc
+import string
 from typing import Optional
 from collections import defaultdict
 import jax
@@ -216,6 +218,10 @@ def copy_dict(d: dict) -> dict:
     return copy.deepcopy(d)
 
 
+# Chain identifiers that may prefix a range token (e.g. the 'A' in 'A5-10')
+_CHAIN_LETTERS = frozenset(string.ascii_letters)
+
+
 def idx_from_ranges(ranges, chain="B", offset=0):
     """Convert range string specification to zero-based index list.
     
@@ -235,7 +241,7 @@ def idx_from_ranges(ranges, chain="B", offset=0):
     rows = []
     ranges = ranges.replace(chain, "")
     for part in ranges.split(","):
-        if part[0].isalpha():
+        if part[:1] in _CHAIN_LETTERS:
             part = part[1:]
             if "-" in part:
                 start, end = map(int, part.split("-"))
@@ -306,6 +312,30 @@ def get_sequence_from_pdb(pdb_path: str) -> dict:
     return chains
 
 
+def get_chain_sequence_from_pdb(pdb_path: str, chain: str) -> str:
+    """Extract the protein sequence of a single chain from a PDB file.
+    
+    Like get_sequence_from_pdb, but only converts the requested chain to
+    single-letter code.
+    
+    Args:
+        pdb_path (str): Path to the PDB file to process
+        chain (str): Chain identifier to extract
+        
+    Returns:
+        str: Amino acid sequence of the chain in single-letter code format
+        
+    Raises:
+        KeyError: If the chain is not present in the structure
+    """
+    parser = PDBParser()
+    structure = parser.get_structure("protein", pdb_path)
+    for pdb_chain in structure.get_chains():
+        if pdb_chain.id == chain:
+            return seq1("".join(residue.resname for residue in pdb_chain))
+    raise KeyError(chain)
+
+
 def create_starting_structure(
     save_path,
     binder_pdb,
@@ -333,9 +363,9 @@ def create_starting_structure(
     """
     # Accept either a comma-separated string or a list/tuple of chain IDs
     if isinstance(target_chain, (list, tuple)):
-        target_chain = [str(c).strip() for c in target_chain if str(c).strip()]
+        target_chain = [c for c in (str(x).strip() for x in target_chain) if c]
     else:
-        target_chain = [c.strip() for c in str(target_chain).split(",") if c.strip()]
+        target_chain = [c for c in (t.strip() for t in str(target_chain).split(",")) if c]
 
     # Set up the parser and structure objects
     parser = PDB.PDBParser(QUIET=True)
@@ -364,7 +394,7 @@ def create_starting_structure(
     io.save(save_path)
     print(f"Created starting PDB at: {save_path}")
 
-    return get_sequence_from_pdb(save_path)[binder_chain]
+    return get_chain_sequence_from_pdb(save_path, binder_chain)
 
 
 three_to_one_map = {